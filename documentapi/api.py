@@ -14,18 +14,23 @@ See the License for the specific language governing permissions and
 limitations under the License.
 '''
 
-from aerospike import MAP_RETURN_NONE, MAP_RETURN_VALUE, LIST_RETURN_VALUE
+from aerospike import MAP_RETURN_NONE, MAP_RETURN_VALUE, LIST_RETURN_VALUE, POLICY_EXISTS_UPDATE
 from aerospike import Client
 from aerospike import exception as ex
-from aerospike_helpers.operations import map_operations
-from aerospike_helpers.operations import list_operations
-from aerospike_helpers.operations import operations
-from aerospike_helpers import cdt_ctx
+# Bind operation builders directly to skip module attribute lookups on every call
+from aerospike_helpers.operations.map_operations import map_get_by_key, map_put, map_remove_by_key
+from aerospike_helpers.operations.list_operations import list_get_by_index, list_set, list_pop, list_append
+from aerospike_helpers.operations.operations import read as readOperation, write as writeOperation
+from aerospike_helpers.cdt_ctx import cdt_ctx_list_index, cdt_ctx_map_key
 
 import re
+from functools import lru_cache
+from itertools import islice
 from typing import Any, List, Dict, Tuple, Union
 
+from jsonpath_ng import parse as simpleParse
 from jsonpath_ng.ext import parse
+from jsonpath_ng.exceptions import JSONPathError
 
 from .exception import JsonPathMissingRootError, JsonPathParseError, JSONNotFoundError
 
@@ -60,19 +65,12 @@ class DocumentClient:
         :raises: :exc:`~documentapi.exception.JsonPathParseError`
         :raises: :exc:`~documentapi.exception.JSONNotFoundError`
         """
-        jsonPath = preprocessJsonPath(jsonPath)
-
-        checkSyntax(jsonPath)
-
-        jsonPath, advancedJsonPath = divideJsonPath(jsonPath)
-
         # Split up JSON path into tokens
-        tokens = tokenize(jsonPath)
+        jsonPath, advancedJsonPath, tokens = compileJsonPath(jsonPath)
 
         # Then use tokens to build context arrays
         # except the last token
-        lastToken = tokens.pop()
-        ctxs = buildContextArray(tokens)
+        ctxs, lastToken = buildContextArrayAndLastToken(tokens)
 
         operatePolicy = convertToOperatePolicy(readPolicy)
 
@@ -81,27 +79,88 @@ class DocumentClient:
 
         # Use JSONPath library to perform advanced ops on fetched document
         if advancedJsonPath:
-            jsonPathExpr = parse(advancedJsonPath)
-            fetchedDocument = [match.value for match in jsonPathExpr.find(fetchedDocument)]
-
-            # Check if an advanced operation other than length() exists
-            # Other advanced operations yield a list of results
-            # length() should yield an integer if called at the end
-            # and the path has no other advanced ops
-            matches = [re.search(op, advancedJsonPath) for op in ADVANCED_OP_TOKENS]
-            matches = filter(lambda match: match is not None, matches)
-            matches = list(matches)
-
-            containsOtherAdvancedOps = False
-            for match in matches:
-                if match.re is not re.compile(r"\.`len`"):
-                    containsOtherAdvancedOps = True
-
-            if advancedJsonPath.endswith(".`len`") and containsOtherAdvancedOps is False:
-                fetchedDocument = fetchedDocument[0]
+            fetchedDocument = applyAdvancedJsonPath(fetchedDocument, advancedJsonPath)
 
         return fetchedDocument
 
+    def batchGet(self, keys: List[Key], binName: str, jsonPath: str, batchPolicy: Policy = None) -> List[Any]:
+        """
+        Get object(s) from the JSON documents of multiple records using JSON path.
+
+        All records are read with a single batch request.
+        The results are in the same order as the keys,
+        and each result has the same form as the result of :meth:`get`.
+
+        Each record is checked separately, and the first record that fails raises an error.
+        A missing record raises the same error as :meth:`get`,
+        and a record whose document doesn't match the JSON path raises :exc:`~documentapi.exception.JSONNotFoundError`.
+
+        :param list keys: the keys of the records
+        :param str binName: the name of the bin containing the JSON documents
+        :param str jsonPath: JSON path to retrieve the object from each document
+        :param dict batchPolicy: the batch policy for batch_get_ops() operation
+
+        :return: :py:obj:`list`
+        :raises: :exc:`~documentapi.exception.JsonPathMissingRootError`
+        :raises: :exc:`~documentapi.exception.JsonPathParseError`
+        :raises: :exc:`~documentapi.exception.JSONNotFoundError`
+        :raises: :exc:`~aerospike.exception.RecordNotFound` if one of the records doesn't exist
+        """
+        # Split up JSON path into tokens
+        jsonPath, advancedJsonPath, tokens = compileJsonPath(jsonPath)
+
+        # Then use tokens to build context arrays
+        # except the last token
+        ctxs, lastToken = buildContextArrayAndLastToken(tokens)
+
+        # The same operation is sent for every record
+        getOp = createGetOperation(binName, ctxs, lastToken)
+        fetchedDocuments = getSmallestDocuments(self.client, keys, binName, getOp, batchPolicy, jsonPath)
+
+        if advancedJsonPath:
+            fetchedDocuments = [applyAdvancedJsonPath(document, advancedJsonPath) for document in fetchedDocuments]
+
+        return fetchedDocuments
+
+    def getMany(self, key: Key, binName: str, jsonPaths: List[str], readPolicy: Policy = None) -> Dict[str, Any]:
+        """
+        Get objects from a JSON document using multiple JSON paths.
+
+        All objects are read with a single operate() request.
+        Each result has the same form as the result of :meth:`get`.
+
+        :param tuple key: the key of the record
+        :param str binName: the name of the bin containing the JSON document
+        :param list jsonPaths: JSON paths to retrieve the objects
+        :param dict readPolicy: the read policy for operate_ordered() operation
+
+        :return: :py:obj:`dict` mapping each JSON path to its result
+        :raises: :exc:`~documentapi.exception.JsonPathMissingRootError`
+        :raises: :exc:`~documentapi.exception.JsonPathParseError`
+        :raises: :exc:`~documentapi.exception.JSONNotFoundError`
+        """
+        # Split up each JSON path into tokens
+        compiledJsonPaths = [compileJsonPath(jsonPath) for jsonPath in jsonPaths]
+
+        # Build one operation per JSON path
+        getOps = []
+        for _, _, tokens in compiledJsonPaths:
+            ctxs, lastToken = buildContextArrayAndLastToken(tokens)
+            getOps.append(createGetOperation(binName, ctxs, lastToken))
+
+        operatePolicy = convertToOperatePolicy(readPolicy)
+
+        fetchedDocuments = getSmallestDocumentsForPaths(self.client, key, getOps, operatePolicy, jsonPaths)
+
+        # Results are keyed by the JSON paths passed in
+        results = {}
+        for jsonPath, (_, advancedJsonPath, _), fetchedDocument in zip(jsonPaths, compiledJsonPaths, fetchedDocuments):
+            if advancedJsonPath:
+                fetchedDocument = applyAdvancedJsonPath(fetchedDocument, advancedJsonPath)
+            results[jsonPath] = fetchedDocument
+
+        return results
+
     def put(self, key: Key, binName: str, jsonPath: str, obj: Any, writePolicy: Policy = None):
         """
         Put an object into a JSON document using JSON path.
@@ -115,19 +174,12 @@ class DocumentClient:
         :raises: :exc:`~documentapi.exception.JsonPathParseError`
         :raises: :exc:`~documentapi.exception.JSONNotFoundError`
         """
-        jsonPath = preprocessJsonPath(jsonPath)
-
-        checkSyntax(jsonPath)
-
-        jsonPath, advancedJsonPath = divideJsonPath(jsonPath)
-
         # Split up JSON path into tokens
-        tokens = tokenize(jsonPath)
+        jsonPath, advancedJsonPath, tokens = compileJsonPath(jsonPath)
 
         # Then use tokens to build context arrays
         # except the last token
-        lastToken = tokens.pop()
-        ctxs = buildContextArray(tokens)
+        ctxs, lastToken = buildContextArrayAndLastToken(tokens)
 
         operatePolicy = convertToOperatePolicy(writePolicy)
 
@@ -139,7 +191,7 @@ class DocumentClient:
             smallestDocument = getSmallestDocument(self.client, key, binName, getOp, operatePolicy, jsonPath)
 
             # Update smallest document
-            jsonPathExpr = parse(advancedJsonPath)
+            jsonPathExpr = parseJsonPath(advancedJsonPath)
             jsonPathExpr.update(smallestDocument, obj)
         else:
             smallestDocument = obj
@@ -160,36 +212,39 @@ class DocumentClient:
         :raises: :exc:`~documentapi.exception.JsonPathMissingRootError`
         :raises: :exc:`~documentapi.exception.JsonPathParseError`
         :raises: :exc:`~documentapi.exception.JSONNotFoundError`
+        :raises: :exc:`AttributeError` if the JSON path doesn't end with a list
         """
-        jsonPath = preprocessJsonPath(jsonPath)
-
-        checkSyntax(jsonPath)
-
-        jsonPath, advancedJsonPath = divideJsonPath(jsonPath)
-
         # Split up JSON path into tokens
-        tokens = tokenize(jsonPath)
+        jsonPath, advancedJsonPath, tokens = compileJsonPath(jsonPath)
+
+        operatePolicy = convertToOperatePolicy(writePolicy)
 
         # Then use tokens to build context arrays
         # except the last token
-        lastToken = tokens.pop()
-        ctxs = buildContextArray(tokens)
+        ctxs, lastToken = buildContextArrayAndLastToken(tokens)
+
+        if not advancedJsonPath and lastToken is not ROOT_TOKEN:
+            # The path points to a single list inside the document
+            # so the server can append to it without sending us the document
+            appendToList(self.client, key, binName, tokens, obj, operatePolicy, jsonPath)
+            return
 
         op = createGetOperation(binName, ctxs, lastToken)
 
         # Get document from server
-        operatePolicy = convertToOperatePolicy(writePolicy)
         smallestDocument = getSmallestDocument(self.client, key, binName, op, operatePolicy, jsonPath)
 
         if advancedJsonPath:
             # Append object to all matching lists
-            jsonPathExpr = parse(advancedJsonPath)
+            jsonPathExpr = parseJsonPath(advancedJsonPath)
             matches = jsonPathExpr.find(smallestDocument)
             for match in matches:
                 match.value.append(obj)
-        else:
+        elif type(smallestDocument) is list:
             # List is the whole document
             smallestDocument.append(obj)
+        else:
+            raise AttributeError(f"Unable to append to a non-list object with JSON path {jsonPath}")
 
         # Send new document to server
         op = createPutOperation(binName, ctxs, lastToken, smallestDocument)
@@ -210,19 +265,12 @@ class DocumentClient:
         :raises: :exc:`~documentapi.exception.JsonPathParseError`
         :raises: :exc:`~documentapi.exception.JSONNotFoundError`
         """
-        jsonPath = preprocessJsonPath(jsonPath)
-
-        checkSyntax(jsonPath)
-
-        jsonPath, advancedJsonPath = divideJsonPath(jsonPath)
-
         # Split up JSON path into tokens
-        tokens = tokenize(jsonPath)
+        jsonPath, advancedJsonPath, tokens = compileJsonPath(jsonPath)
 
         # Then use tokens to build context arrays
         # except the last token
-        lastToken = tokens.pop()
-        ctxs = buildContextArray(tokens)
+        ctxs, lastToken = buildContextArrayAndLastToken(tokens)
 
         operatePolicy = convertToOperatePolicy(writePolicy)
 
@@ -232,7 +280,7 @@ class DocumentClient:
             smallestDocument = getSmallestDocument(self.client, key, binName, op, operatePolicy, jsonPath)
 
             # Delete all matches
-            jsonPathExpr = parse(advancedJsonPath)
+            jsonPathExpr = parseJsonPath(advancedJsonPath)
             jsonPathExpr.filter(lambda _: True, smallestDocument)
 
             # Send new document to server
@@ -243,12 +291,12 @@ class DocumentClient:
         # Delete entire matched item
         # Create delete operation
         if type(lastToken) == int:
-            op = list_operations.list_pop(binName, lastToken, ctx=ctxs)
-        elif lastToken == "$":
+            op = list_pop(binName, lastToken, ctx=ctxs)
+        elif lastToken is ROOT_TOKEN:
             # Replace bin with empty dict
-            op = operations.write(binName, {})
+            op = writeOperation(binName, {})
         else:
-            op = map_operations.map_remove_by_key(binName, lastToken, MAP_RETURN_NONE, ctx=ctxs)
+            op = map_remove_by_key(binName, lastToken, MAP_RETURN_NONE, ctx=ctxs)
 
         # Tada
         try:
@@ -268,12 +316,57 @@ ADVANCED_OP_TOKENS = (
     # Also check for negative indices
     r"\[(-?\d+)?\:(-?\d+)?(\:-?\d+)?\]",    # start:(end)?(:step)?
     r"\[-?\d+(\,-?\d+)+\]",                 # [idx1,idx2,...]
+    # Keys may be quoted, so commas inside quotes don't separate fields
+    r"\[\s*('[^']*'|\"[^\"]*\"|[\w@-]+)(\s*,\s*('[^']*'|\"[^\"]*\"|[\w@-]+))+\s*\]",  # [key1,key2,...]
     r"\.`len`"                              # .`len`
 )
 
+# Compile the tokens once instead of on every search
+ADVANCED_OP_PATTERNS = tuple(re.compile(token) for token in ADVANCED_OP_TOKENS)
+LENGTH_OP_PATTERN = ADVANCED_OP_PATTERNS[-1]
+
+# Every advanced operation except .. contains at least one of these
+ADVANCED_OP_CHARACTERS = frozenset("*?:,`")
+
+# Number of distinct JSON paths to keep parsed results for
+JSON_PATH_CACHE_SIZE = 1024
+
+
 # Helper functions for the api module
 
 
+# Check, divide and tokenize a JSON path
+def compileJsonPath(jsonPath: str) -> Tuple[str, Union[str, None], Tuple[Any, ...]]:
+    compiledJsonPath, syntaxError = tryCompileJsonPath(jsonPath)
+    if syntaxError:
+        # Raise a new exception each time so earlier tracebacks aren't kept alive by the cache
+        errorClass, errorArgs = syntaxError
+        raise errorClass(*errorArgs)
+    return compiledJsonPath
+
+
+# Every step only depends on the path, so results are cached for repeated paths
+# Syntax errors are returned instead of raised so invalid paths are cached too
+# Tokens are returned as a tuple so cached results can't be modified
+@lru_cache(maxsize=JSON_PATH_CACHE_SIZE)
+def tryCompileJsonPath(jsonPath: str):
+    jsonPath = preprocessJsonPath(jsonPath)
+
+    try:
+        checkSyntax(jsonPath)
+    except JsonPathMissingRootError:
+        return None, (JsonPathMissingRootError, (jsonPath,))
+    except JsonPathParseError as e:
+        # Keep the parser's explanation, but not the parser exception and its traceback
+        return None, (JsonPathParseError, (jsonPath, e.reason))
+
+    jsonPath, advancedJsonPath = divideJsonPath(jsonPath)
+
+    tokens = tuple(tokenize(jsonPath))
+
+    return (jsonPath, advancedJsonPath, tokens), None
+
+
 def preprocessJsonPath(jsonPath: str) -> str:
     # Replace any .length() calls with .`len`
     # Our JSONPath library only processes the latter
@@ -288,18 +381,62 @@ def checkSyntax(jsonPath: str):
 
     # Check for syntax errors
     try:
-        parse(jsonPath)
-    except Exception:
-        raise JsonPathParseError(jsonPath)
+        parseJsonPath(jsonPath)
+    except JSONPathError as e:
+        raise JsonPathParseError(jsonPath, str(e)) from e
+    except Exception as e:
+        # The parser fails with an internal error at the end of some paths
+        # Its message doesn't describe the path, so leave it out
+        raise JsonPathParseError(jsonPath) from e
+
+
+# Filters and named operators like `len` need the extended parser
+EXTENDED_SYNTAX_PATTERN = re.compile(r"[?`]")
+
+
+# Parsed JSON paths never change, so reuse them across calls
+@lru_cache(maxsize=JSON_PATH_CACHE_SIZE)
+def parseJsonPath(jsonPath: str):
+    # The simple parser is considerably faster than the extended one
+    if EXTENDED_SYNTAX_PATTERN.search(jsonPath) is None:
+        try:
+            return simpleParse(jsonPath)
+        except Exception:
+            # Let the extended parser decide whether the path is valid
+            pass
+    return parse(jsonPath)
+
+
+# Use JSONPath library to perform advanced ops on a fetched document
+def applyAdvancedJsonPath(fetchedDocument: Any, advancedJsonPath: str) -> Any:
+    jsonPathExpr = parseJsonPath(advancedJsonPath)
+    results = [match.value for match in jsonPathExpr.find(fetchedDocument)]
+
+    # Check if an advanced operation other than length() exists
+    # Other advanced operations yield a list of results
+    # length() should yield an integer if called at the end
+    # and the path has no other advanced ops
+    containsOtherAdvancedOps = any(
+        pattern.search(advancedJsonPath) for pattern in ADVANCED_OP_PATTERNS if pattern is not LENGTH_OP_PATTERN
+    )
+
+    if advancedJsonPath.endswith(".`len`") and containsOtherAdvancedOps is False:
+        return results[0]
+
+    return results
 
 
 # Divide JSON path into two parts
 # The first part does not have advanced operations
 # The second part starts with the first advanced operation in the path
 def divideJsonPath(jsonPath: str) -> Tuple[str, Union[str, None]]:
+    # Skip the regex searches if no advanced operation can be in the path
+    if ".." not in jsonPath and ADVANCED_OP_CHARACTERS.isdisjoint(jsonPath):
+        return jsonPath, None
+
     # Get substring in path beginning with the first advanced operation
     # Look for operations in path
-    matches = [re.search(op, jsonPath) for op in ADVANCED_OP_TOKENS]
+    matches = [pattern.search(jsonPath) for pattern in ADVANCED_OP_PATTERNS]
     # Filter out operations not in path
     matches = filter(lambda match: match is not None, matches)
     matches = list(matches)
@@ -321,43 +458,53 @@ def divideJsonPath(jsonPath: str) -> Tuple[str, Union[str, None]]:
     return jsonPath, advancedJsonPath
 
 
+# Map keys in dot notation end before one of these characters
+DOT_NOTATION_END_PATTERN = re.compile(r"[.\[]")
+
+# A key or index in bracket notation
+# Whitespace is allowed around it, and keys may be single quoted, double quoted or unquoted
+BRACKET_TOKEN_PATTERN = re.compile(r"\[\s*(?:(['\"])(.*?)\1|(-?\d+)|([\w@-]+))\s*\]")
+
+# Token for the document root
+# A sentinel can't be confused with a map key named "$"
+ROOT_TOKEN = object()
+
+
 # Split up JSON path without advanced operations
 # into map and list access tokens
-def tokenize(firstJsonPath: str) -> List[str]:
-    tokens = []
-    token = ""
-    quoteCount = 0
-
-    for c in firstJsonPath:
-        if c in ".[]" and quoteCount % 2 == 0:
-            # Finished reading token
-            # We know if the token is a finished quote if every quotation has a match
-            if token == "":
-                # No token found
-                continue
-
-            if c == ']':
-                # Bracket notation
-                if quoteCount > 0:
-                    # Just finished reading a map key
-                    token = token[1:-1]
-                    quoteCount = 0
-                else:
-                    # Assume we read an index
-                    token = int(token)
-
-            # Save token
-            tokens.append(token)
-            token = ""
+def tokenize(firstJsonPath: str) -> List[Any]:
+    # The path always starts at the document root
+    tokens = [ROOT_TOKEN]
+    pathLength = len(firstJsonPath)
+    i = 1
+
+    # Scan the path once and slice out each token
+    while i < pathLength:
+        c = firstJsonPath[i]
+        if c == '.':
+            # Separator between tokens
+            i += 1
+        elif c == '[':
+            # Bracket notation
+            # Lists of keys or indices were moved to the advanced path by divideJsonPath()
+            # so the bracket holds a single key or index
+            match = BRACKET_TOKEN_PATTERN.match(firstJsonPath, i)
+            quotedKey, index, unquotedKey = match.group(2, 3, 4)
+            if index is not None:
+                tokens.append(int(index))
+            elif quotedKey is not None:
+                # Brackets and dots inside the quotes are part of the key
+                tokens.append(quotedKey)
+            else:
+                tokens.append(unquotedKey)
+            i = match.end()
         else:
-            if c == '\'':
-                quoteCount += 1
-            token = token + c
-
-    # Flush out the rest of the buffer into last token
-    # This is a map access (in dot notation)
-    if token:
-        tokens.append(token)
+            # Map access (in dot notation)
+            # The key ends at the next separator or the end of the path
+            match = DOT_NOTATION_END_PATTERN.search(firstJsonPath, i)
+            tokenEnd = match.start() if match else pathLength
+            tokens.append(firstJsonPath[i:tokenEnd])
+            i = tokenEnd
 
     # Special case: path ending with * returns the previous object
     if tokens[-1] == '*':
@@ -366,90 +513,148 @@ def tokenize(firstJsonPath: str) -> List[str]:
     return tokens
 
 
-def buildContextArray(tokens: List[str]) -> Union[List[str], None]:
+def buildContextArray(tokens: Tuple[Any, ...], stop: int = None) -> Union[List[Any], None]:
+    ctxs = buildContexts(tokens, stop)
+    if not ctxs:
+        # Contexts must be populated or None
+        return None
+
+    # Every operation gets its own list, so cached contexts can't be modified through it
+    return list(ctxs)
+
+
+# Tokens from compileJsonPath() are hashable, so contexts are built once per path
+# Contexts are returned as a tuple so cached results can't be modified
+@lru_cache(maxsize=JSON_PATH_CACHE_SIZE)
+def buildContexts(tokens: Tuple[Any, ...], stop: int = None) -> Tuple[Any, ...]:
+    # Only use tokens before the stop index if one is provided
     ctxs = []
-    for token in tokens:
+    for token in islice(tokens, stop):
         if type(token) == int:
             # List access
-            ctx = cdt_ctx.cdt_ctx_list_index(token)
-        elif token == '$':
+            ctx = cdt_ctx_list_index(token)
+        elif token is ROOT_TOKEN:
             # Don't need context for root
             continue
         else:
             # Map access
-            ctx = cdt_ctx.cdt_ctx_map_key(token)
+            ctx = cdt_ctx_map_key(token)
         ctxs.append(ctx)
 
-    if not ctxs:
-        # Contexts must be populated or None
-        return None
+    return tuple(ctxs)
 
-    return ctxs
 
+# The last token is used by the operation itself, not as a context
+def buildContextArrayAndLastToken(tokens: Tuple[Any, ...]) -> Tuple[Union[List[Any], None], Any]:
+    return buildContextArray(tokens, len(tokens) - 1), tokens[-1]
 
-def createGetOperation(binName: str, ctxs: list, lastToken: str) -> dict:
+
+def createGetOperation(binName: str, ctxs: list, lastToken: Any) -> dict:
     # Create get operation using last token
     if type(lastToken) == int:
-        op = list_operations.list_get_by_index(binName, lastToken, LIST_RETURN_VALUE, ctxs)
-    elif lastToken == "$":
+        op = list_get_by_index(binName, lastToken, LIST_RETURN_VALUE, ctxs)
+    elif lastToken is ROOT_TOKEN:
         # Get whole document
-        op = operations.read(binName)
+        op = readOperation(binName)
     else:
-        op = map_operations.map_get_by_key(binName, lastToken, MAP_RETURN_VALUE, ctxs)
+        op = map_get_by_key(binName, lastToken, MAP_RETURN_VALUE, ctxs)
 
     return op
 
 
-def createPutOperation(binName: str, ctxs: list, lastToken: str, obj: Any) -> dict:
+def createPutOperation(binName: str, ctxs: list, lastToken: Any, obj: Any) -> dict:
     # Create put operation
     if type(lastToken) == int:
-        op = list_operations.list_set(binName, lastToken, obj, ctx=ctxs)
-    elif lastToken == "$":
+        op = list_set(binName, lastToken, obj, ctx=ctxs)
+    elif lastToken is ROOT_TOKEN:
         # Get whole document
-        op = operations.write(binName, obj)
+        op = writeOperation(binName, obj)
     else:
-        op = map_operations.map_put(binName, lastToken, obj, ctx=ctxs)
+        op = map_put(binName, lastToken, obj, ctx=ctxs)
 
     return op
 
 
-OPERATE_CONFIG_KEYS = (
+OPERATE_CONFIG_KEYS = frozenset((
     "max_retries", "sleep_between_retries", "socket_timeout", "total_timeout", "compress", "key", "gen", "replica",
     "commit_level", "read_mode_ap", "read_mode_sc", "exists", "durable_delete", "expressions"
-)
+))
 
 
 def convertToOperatePolicy(policy: Policy) -> Union[Policy, None]:
     if policy is None:
         return None
 
-    # Filter out non-operate policies
-    operatePolicy = policy.copy()
-    for key in policy:
-        if key not in OPERATE_CONFIG_KEYS:
-            operatePolicy.pop(key)
+    if policy.keys() <= OPERATE_CONFIG_KEYS:
+        # Already a valid operate policy
+        return policy
 
-    return operatePolicy
+    # Filter out non-operate policies
+    return {key: policy[key] for key in policy.keys() & OPERATE_CONFIG_KEYS}
 
 # These functions handle possible errors from calling operate()
 # Pass in JSON path in case we throw an error
 
 
 def getSmallestDocument(client: Client, key: Key, binName: str, op: Any, operatePolicy: Policy, jsonPath: str):
+    # Only the server call is guarded
+    # The client reports failed operations with exceptions only
     try:
         _, _, bins = client.operate(key, [op], operatePolicy)
-        fetchedDocument = bins[binName]
-        if fetchedDocument is None:
-            # Caused by using a key that doesn't exist in a map
-            raise JSONNotFoundError(jsonPath)
     except (ex.BinIncompatibleType, ex.InvalidRequest, ex.OpNotApplicable):
         # InvalidRequest: index get() on a map or primitive
         # BinIncompatibleType: key get() on a list or primitive
         # OpNotApplicable: get() from missing list/map or out of bounds index
         raise JSONNotFoundError(jsonPath)
+
+    fetchedDocument = bins[binName]
+    if fetchedDocument is None:
+        # Caused by using a key that doesn't exist in a map
+        raise JSONNotFoundError(jsonPath)
     return fetchedDocument
 
 
+def getSmallestDocuments(client: Client, keys: List[Key], binName: str, op: Any, batchPolicy: Policy, jsonPath: str):
+    # The third positional argument is record metadata, so the policy must be passed by name
+    # Failed operations don't raise, they are reported per record with no bins
+    records = client.batch_get_ops(keys, [op], policy=batchPolicy)
+
+    fetchedDocuments = []
+    for key, meta, bins in records:
+        if bins is None and isRecordNotFound(meta):
+            # Same error get() raises for a missing record
+            raise ex.RecordNotFound(ex.RecordNotFound.code, f"Record not found: {key}")
+        if not bins or bins.get(binName) is None:
+            # The path doesn't match its document
+            # or the object doesn't exist in its document
+            raise JSONNotFoundError(jsonPath)
+        fetchedDocuments.append(bins[binName])
+    return fetchedDocuments
+
+
+# A missing record is reported with the exception type in place of its metadata
+def isRecordNotFound(meta: Any) -> bool:
+    return meta is ex.RecordNotFound or isinstance(meta, ex.RecordNotFound)
+
+
+# Operations on the same bin must be read in order, since operate() only keeps one result per bin
+def getSmallestDocumentsForPaths(client: Client, key: Key, ops: list, operatePolicy: Policy, jsonPaths: List[str]):
+    try:
+        _, _, bins = client.operate_ordered(key, ops, policy=operatePolicy)
+    except (ex.BinIncompatibleType, ex.InvalidRequest, ex.OpNotApplicable):
+        # Same causes as getSmallestDocument()
+        # The server doesn't report which operation failed
+        raise JSONNotFoundError(", ".join(jsonPaths))
+
+    fetchedDocuments = []
+    for jsonPath, (_, fetchedDocument) in zip(jsonPaths, bins):
+        if fetchedDocument is None:
+            # Caused by using a key that doesn't exist in a map
+            raise JSONNotFoundError(jsonPath)
+        fetchedDocuments.append(fetchedDocument)
+    return fetchedDocuments
+
+
 def sendSmallestDocument(client: Client, key: Key, op, operatePolicy: Policy, jsonPath: str):
     try:
         _, _, _ = client.operate(key, [op], operatePolicy)
@@ -459,3 +664,28 @@ def sendSmallestDocument(client: Client, key: Key, op, operatePolicy: Policy, js
         # - put() into list as map
         # - put() into missing list/map
         raise JSONNotFoundError(jsonPath)
+
+
+# Appending must not create a missing record, just like reading the list first wouldn't
+APPEND_POLICY = {"exists": POLICY_EXISTS_UPDATE}
+
+
+def appendToList(client: Client, key: Key, binName: str, tokens: Tuple[Any, ...], obj: Any, operatePolicy: Policy,
+                 jsonPath: str):
+    # The caller's policy can't override the exists policy, or a missing record could be created
+    appendPolicy = {**operatePolicy, **APPEND_POLICY} if operatePolicy else APPEND_POLICY
+    op = list_append(binName, obj, ctx=buildContextArray(tokens))
+    try:
+        client.operate(key, [op], policy=appendPolicy)
+    except (ex.InvalidRequest, ex.OpNotApplicable):
+        # InvalidRequest: index context on a map or primitive
+        # OpNotApplicable: append() to missing list/map or out of bounds index
+        raise JSONNotFoundError(jsonPath)
+    except ex.BinIncompatibleType:
+        # BinIncompatibleType: append() to a map or primitive, or a key context on a list or primitive
+        # Read the target to tell them apart
+        # The read raises JSONNotFoundError if the path doesn't exist
+        ctxs, lastToken = buildContextArrayAndLastToken(tokens)
+        op = createGetOperation(binName, ctxs, lastToken)
+        getSmallestDocument(client, key, binName, op, operatePolicy, jsonPath)
+        raise AttributeError(f"Unable to append to a non-list object with JSON path {jsonPath}")
@@ -9,8 +9,12 @@ class JsonPathMissingRootError(ValueError):
 class JsonPathParseError(ValueError):
     """This is thrown when the JSON path has invalid syntax."""
 
-    def __init__(self, jsonPath):
+    def __init__(self, jsonPath, reason=None):
+        self.reason = reason
         message = f"Unable to parse JSON path: {jsonPath}"
+        if reason:
+            # Explanation from the JSONPath parser
+            message = f"{message} ({reason})"
         super().__init__(message)
 
 
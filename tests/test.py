@@ -16,8 +16,9 @@ limitations under the License.
 
 import os
 import unittest
-import copy
+from unittest.mock import MagicMock
 import json
+from collections import Counter, deque
 import aerospike
 
 from documentapi import DocumentClient
@@ -27,21 +28,26 @@ from documentapi.exception import JsonPathMissingRootError, JsonPathParseError,
 LIST_BIN_NAME = "testList"
 MAP_BIN_NAME = "testMap"
 
+# Record shared by test classes that only read it
+READ_ONLY_KEY_TUPLE = ('test', 'demo', 'key-readOnly')
+
 
 def setUpModule():
     # Need to access these variables across all test cases
-    global mapJsonFile, listJsonFile
-    global mapJsonObj, listJsonObj
-    global client, documentClient, keyTuple
+    global mapJsonObj, listJsonObj, recordBins
+    global client, documentClient
 
-    # Open JSON test files
+    # Parse JSON test files into Python objects
+    # Files are closed right away since only the objects are needed
     TEST_MAP_FILE_PATH = os.path.join(os.path.dirname(__file__), "testMap.json")
     TEST_LIST_FILE_PATH = os.path.join(os.path.dirname(__file__), "testList.json")
-    mapJsonFile = open(TEST_MAP_FILE_PATH)
-    listJsonFile = open(TEST_LIST_FILE_PATH)
-    # Parse them into Python objects
-    mapJsonObj = json.load(mapJsonFile)
-    listJsonObj = json.load(listJsonFile)
+    with open(TEST_MAP_FILE_PATH) as mapJsonFile:
+        mapJsonObj = json.load(mapJsonFile)
+    with open(TEST_LIST_FILE_PATH) as listJsonFile:
+        listJsonObj = json.load(listJsonFile)
+    # Bins of a record containing both documents
+    # Tests must not modify the documents so this can be reused
+    recordBins = {MAP_BIN_NAME: mapJsonObj, LIST_BIN_NAME: listJsonObj}
 
     # Setup client
     config = {
@@ -50,170 +56,172 @@ def setUpModule():
     client = aerospike.client(config).connect()
     documentClient = DocumentClient(client)
 
-    # Record key for all tests
-    keyTuple = ('test', 'demo', 'key')
+    # Insert the read-only record once for all get tests
+    client.put(READ_ONLY_KEY_TUPLE, recordBins)
 
 
 def tearDownModule():
-    # Close file descriptors
-    mapJsonFile.close()
-    listJsonFile.close()
+    client.remove(READ_ONLY_KEY_TUPLE)
+
     # Close client connection
     client.close()
 
 
 # Helper function for all tests
 
-def deleteJsonMapValuesRecursively(jsonObj, key=None):
-    if type(jsonObj) == list:
-        # Recurse through every element in list
-        for element in jsonObj:
-            deleteJsonMapValuesRecursively(element, key)
-
-    if type(jsonObj) != dict:
-        # Object cannot have any key-value pairs
-        return
-
-    # Delete all matching keys and recurse into remaining values
-    keysToDelete = []
-    for iteratedKey in jsonObj.keys():
-        value = jsonObj[iteratedKey]
-        if key is None or iteratedKey == key:
-            # Matches
-            keysToDelete.append(key)
-        else:
-            deleteJsonMapValuesRecursively(value, key)
-
-    for key in keysToDelete:
-        del jsonObj[key]
+# Only these types can contain key-value pairs
+CONTAINER_TYPES = (list, dict)
 
 
-# Gets all values if a key is not provided
+def deleteJsonMapValuesRecursively(jsonObj, key=None):
+    # Walk the document with an explicit stack instead of recursion
+    # Only containers are pushed, since primitives have no key-value pairs
+    stack = deque([jsonObj] if type(jsonObj) in CONTAINER_TYPES else [])
+    # Bind methods used in the loop to locals
+    popStack, extendStack = stack.pop, stack.extend
+    while stack:
+        obj = popStack()
+        if type(obj) is list:
+            # Visit every container in list
+            extendStack(element for element in obj if type(element) in CONTAINER_TYPES)
+            continue
+
+        if key is None:
+            # Every key matches, so nothing is left to visit
+            obj.clear()
+            continue
+
+        # Delete the matching key and visit remaining values
+        obj.pop(key, None)
+        extendStack(value for value in obj.values() if type(value) in CONTAINER_TYPES)
+
+
+# Yields all values if a key is not provided
+# Values are generated lazily so callers can stop early
 def getJsonMapValuesRecursively(jsonObj, key=None):
-    if type(jsonObj) == list:
-        # Recurse through every element in list
-        values = []
-        for element in jsonObj:
-            elementValues = getJsonMapValuesRecursively(element, key)
-            values.extend(elementValues)
-        return values
-
-    if type(jsonObj) != dict:
-        # Object cannot have any key-value pairs
-        return []
-
-    # Add all matching keys and recurse into each value
-    values = []
-    for iteratedKey in jsonObj.keys():
-        value = jsonObj[iteratedKey]
-        if key is None or iteratedKey == key:
+    # Walk the document with an explicit stack instead of recursion
+    # Only containers are pushed, since primitives have no key-value pairs
+    stack = deque([jsonObj] if type(jsonObj) in CONTAINER_TYPES else [])
+    # Bind methods used in the loop to locals
+    popStack, extendStack = stack.pop, stack.extend
+    while stack:
+        obj = popStack()
+        if type(obj) is list:
+            # Visit every container in list
+            extendStack(element for element in obj if type(element) in CONTAINER_TYPES)
+            continue
+
+        # Yield all matching keys and visit each value
+        if key is None:
+            yield from obj.values()
+        elif key in obj:
             # Matches
-            values.append(value)
-        nestedValues = getJsonMapValuesRecursively(value, key)
-        values.extend(nestedValues)
-    return values
+            yield obj[key]
+        extendStack(value for value in obj.values() if type(value) in CONTAINER_TYPES)
 
 
-class TestGets(unittest.TestCase):
+# Fixtures are never modified, so values found in them can be reused
+# Keyed by the fixture object's id and the key to search for
+fixtureMapValues = {}
 
-    @classmethod
-    def setUpClass(cls):
-        # Insert record with two bins
-        # Each bin contains a JSON document
-        client.put(keyTuple, {LIST_BIN_NAME: listJsonObj})
-        client.put(keyTuple, {MAP_BIN_NAME: mapJsonObj})
 
-    @classmethod
-    def tearDownClass(cls):
-        # Remove record with two documents
-        client.remove(keyTuple)
+def getFixtureJsonMapValuesRecursively(jsonObj, key=None):
+    cacheKey = (id(jsonObj), key)
+    if cacheKey not in fixtureMapValues:
+        fixtureMapValues[cacheKey] = list(getJsonMapValuesRecursively(jsonObj, key))
+    return fixtureMapValues[cacheKey]
 
 
-class TestCorrectGets(TestGets):
+# Key of the record used by a test class
+def recordKeyForClass(cls):
+    return ('test', 'demo', f'key-{cls.__name__}')
 
-    def testGetRoot(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$")
-        self.assertEqual(results, mapJsonObj)
-
-    # First order elements
 
-    def testGetKey(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.map")
-        self.assertEqual(results, mapJsonObj["map"])
-
-    def testGetIndex(self):
-        results = documentClient.get(keyTuple, LIST_BIN_NAME, "$[0]")
-        self.assertEqual(results, listJsonObj[0])
+# Copy a JSON object
+# A JSON round trip is faster than copy.deepcopy() for plain JSON data
+def cloneJson(jsonObj):
+    return json.loads(json.dumps(jsonObj))
 
-    # Second order elements
 
-    def testGetTwoKeys(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.map.map")
-        self.assertEqual(results, mapJsonObj["map"]["map"])
+# Convert a JSON object into an equivalent hashable string
+# Keys are sorted since key order doesn't matter when comparing maps
+def canonicalizeJson(jsonObj):
+    return json.dumps(jsonObj, sort_keys=True)
 
-    def testGetKeyThenIndex(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, '$.list[0]')
-        self.assertEqual(results, mapJsonObj["list"][0])
-
-    def testGetIndexThenKey(self):
-        results = documentClient.get(keyTuple, LIST_BIN_NAME, '$[0].map')
-        self.assertEqual(results, listJsonObj[0]["map"])
-
-    def testGetTwoIndices(self):
-        results = documentClient.get(keyTuple, LIST_BIN_NAME, '$[1][0]')
-        self.assertEqual(results, listJsonObj[1][0])
 
+# Valid JSON paths and how to find the expected object in the bin's document
+GET_CASES = (
+    (MAP_BIN_NAME, "$", lambda document: document),
+    # First order elements
+    (MAP_BIN_NAME, "$.map", lambda document: document["map"]),
+    (LIST_BIN_NAME, "$[0]", lambda document: document[0]),
+    # Second order elements
+    (MAP_BIN_NAME, "$.map.map", lambda document: document["map"]["map"]),
+    (MAP_BIN_NAME, "$.list[0]", lambda document: document["list"][0]),
+    (LIST_BIN_NAME, "$[0].map", lambda document: document[0]["map"]),
+    (LIST_BIN_NAME, "$[1][0]", lambda document: document[1][0]),
     # Third order elements
+    (MAP_BIN_NAME, "$.map.map.int", lambda document: document["map"]["map"]["int"]),
+    (MAP_BIN_NAME, "$.map.list[0]", lambda document: document["map"]["list"][0]),
+    (MAP_BIN_NAME, "$.list[0].int", lambda document: document["list"][0]["int"]),
+    (MAP_BIN_NAME, "$.list[1][0]", lambda document: document["list"][1][0]),
+    (LIST_BIN_NAME, "$[0].map.int", lambda document: document[0]["map"]["int"]),
+    (LIST_BIN_NAME, "$[0].list[0]", lambda document: document[0]["list"][0]),
+    (LIST_BIN_NAME, "$[1][0].int", lambda document: document[1][0]["int"]),
+    (LIST_BIN_NAME, "$[1][1][0]", lambda document: document[1][1][0]),
+    # Bracket notation
+    (MAP_BIN_NAME, "$['map']", lambda document: document["map"]),
+    (MAP_BIN_NAME, "$['map']['map']", lambda document: document["map"]["map"]),
+    (MAP_BIN_NAME, "$['key.with.dots']", lambda document: document["key.with.dots"]),
+    (MAP_BIN_NAME, "$['key[with.brackets]']", lambda document: document["key[with.brackets]"]),
+    # Other bracket forms accepted by the JSON path syntax
+    (MAP_BIN_NAME, "$[ 'map' ]", lambda document: document["map"]),
+    (MAP_BIN_NAME, "$['map' ]['map']", lambda document: document["map"]["map"]),
+    (MAP_BIN_NAME, '$["map"]', lambda document: document["map"]),
+    (MAP_BIN_NAME, "$[map]", lambda document: document["map"]),
+    (LIST_BIN_NAME, "$[ 1 ][0]", lambda document: document[1][0]),
+    # Lists of keys
+    (MAP_BIN_NAME, "$.map[map,list]", lambda document: [document["map"]["map"], document["map"]["list"]]),
+    (MAP_BIN_NAME, "$.map['map','list']", lambda document: [document["map"]["map"], document["map"]["list"]]),
+)
+
+# Invalid JSON paths and the error each one raises
+GET_SYNTAX_ERROR_CASES = (
+    (MAP_BIN_NAME, "", JsonPathMissingRootError),
+    (MAP_BIN_NAME, "list", JsonPathMissingRootError),
+    # Trailing period
+    (MAP_BIN_NAME, "$.", JsonPathParseError),
+    (MAP_BIN_NAME, "$.asdf.", JsonPathParseError),
+    # Trailing recursive descent
+    (MAP_BIN_NAME, "$..", JsonPathParseError),
+    # Trailing opening bracket
+    (LIST_BIN_NAME, "$[", JsonPathParseError),
+    (MAP_BIN_NAME, "$.list[", JsonPathParseError),
+    # Empty brackets
+    (LIST_BIN_NAME, "$[]", JsonPathParseError),
+    (MAP_BIN_NAME, "$.list[]", JsonPathParseError),
+    # Unmatched closing bracket
+    (LIST_BIN_NAME, "$]", JsonPathParseError),
+    (MAP_BIN_NAME, "$.list]", JsonPathParseError),
+)
 
-    def testGetThreeKeys(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.map.map.int")
-        self.assertEqual(results, mapJsonObj["map"]["map"]["int"])
-
-    def testGetTwoKeysThenIndex(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.map.list[0]")
-        self.assertEqual(results, mapJsonObj["map"]["list"][0])
 
-    def testGetKeyIndexKey(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.list[0].int")
-        self.assertEqual(results, mapJsonObj["list"][0]["int"])
-
-    def testGetKeyThenTwoIndices(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.list[1][0]")
-        self.assertEqual(results, mapJsonObj["list"][1][0])
-
-    def testGetIndexThenTwoKeys(self):
-        results = documentClient.get(keyTuple, LIST_BIN_NAME, "$[0].map.int")
-        self.assertEqual(results, listJsonObj[0]["map"]["int"])
-
-    def testGetIndexKeyIndex(self):
-        results = documentClient.get(keyTuple, LIST_BIN_NAME, "$[0].list[0]")
-        self.assertEqual(results, listJsonObj[0]["list"][0])
-
-    def testGetTwoIndicesThenKey(self):
-        results = documentClient.get(keyTuple, LIST_BIN_NAME, "$[1][0].int")
-        self.assertEqual(results, listJsonObj[1][0]["int"])
-
-    def testGetThreeIndices(self):
-        results = documentClient.get(keyTuple, LIST_BIN_NAME, "$[1][1][0]")
-        self.assertEqual(results, listJsonObj[1][1][0])
-
-    # Bracket notation tests
+class TestGets(unittest.TestCase):
 
-    def testGetOneKeyInBracket(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$['map']")
-        self.assertEqual(results, mapJsonObj["map"])
+    @classmethod
+    def setUpClass(cls):
+        # Get tests never modify the record
+        # so they all share the one inserted in setUpModule()
+        cls.keyTuple = READ_ONLY_KEY_TUPLE
 
-    def testGetTwoKeysInBracket(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$['map']['map']")
-        self.assertEqual(results, mapJsonObj["map"]["map"])
 
-    def testGetKeyWithDots(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$['key.with.dots']")
-        self.assertEqual(results, mapJsonObj["key.with.dots"])
+class TestCorrectGets(TestGets):
 
-    def testGetKeyWithBrackets(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$['key[with.brackets]']")
-        self.assertEqual(results, mapJsonObj["key[with.brackets]"])
+    def testGetPaths(self):
+        for binName, jsonPath, getExpected in GET_CASES:
+            with self.subTest(jsonPath=jsonPath):
+                results = documentClient.get(self.keyTuple, binName, jsonPath)
+                self.assertEqual(results, getExpected(recordBins[binName]))
 
     def testGetWithInvalidOperatePolicy(self):
         # This read policy should be filtered out
@@ -221,12 +229,40 @@ class TestCorrectGets(TestGets):
         readPolicy = {
             "deserialize": False
         }
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$['key[with.brackets]']", readPolicy)
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$['key[with.brackets]']", readPolicy)
         self.assertEqual(results, mapJsonObj["key[with.brackets]"])
 
+    def testGetWithValidOperatePolicy(self):
+        # This read policy can be used as is
+        readPolicy = {
+            "total_timeout": 2000
+        }
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.map", readPolicy)
+        self.assertEqual(results, mapJsonObj["map"])
+
 
 class TestGetAdvancedOps(TestGets):
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        # Expected results only depend on the fixtures
+        # so compute them once for the whole class
+        cls.expectedWildstarLengths = [len(element) for element in listJsonObj]
+        innerList = listJsonObj[1]
+        cls.expectedListSlices = {
+            "$[1][2:4]": innerList[2:4],
+            "$[1][:2]": innerList[:2],
+            "$[1][2:]": innerList[2:],
+            "$[1][-1:]": innerList[-1:],
+            "$[1][3:-1]": innerList[3:-1],
+            "$[1][3,5]": [innerList[3], innerList[5]],
+            "$[1][2:5:2]": innerList[2:5:2],
+            "$[1][:4:2]": innerList[:4:2],
+            "$[1][::2]": innerList[::2]
+        }
+
     # get() may return multiple matches in any order
     # This function checks if the functions return the expected matches
     @staticmethod
@@ -235,242 +271,326 @@ class TestGetAdvancedOps(TestGets):
             # Unequal lengths
             return False
 
-        # Don't modify original lists to compare them
-        list1 = copy.deepcopy(list1)
-        list2 = copy.deepcopy(list2)
+        canonicalList1 = [canonicalizeJson(element) for element in list1]
+        canonicalList2 = [canonicalizeJson(element) for element in list2]
+
+        uniqueElements1 = frozenset(canonicalList1)
+        if len(uniqueElements1) == len(canonicalList1):
+            # No duplicates, so comparing sets is enough
+            return uniqueElements1 == frozenset(canonicalList2)
 
-        while list2:
-            element = list2.pop()
-            if element not in list1:
-                return False
-            list1.remove(element)
-        return len(list1) == 0
+        # Compare how many times each element appears
+        return Counter(canonicalList1) == Counter(canonicalList2)
 
     # Wildstar index tests
 
     def testGetWildstarIndex(self):
-        results = documentClient.get(keyTuple, LIST_BIN_NAME, "$[*]")
+        results = documentClient.get(self.keyTuple, LIST_BIN_NAME, "$[*]")
         self.assertTrue(self.isListEqualUnsorted(results, listJsonObj))
 
     def testGetNestedWildstarIndex(self):
-        results = documentClient.get(keyTuple, LIST_BIN_NAME, "$[1][*]")
+        results = documentClient.get(self.keyTuple, LIST_BIN_NAME, "$[1][*]")
         expected = listJsonObj[1]
         self.assertTrue(self.isListEqualUnsorted(results, expected))
 
     def testGetWildstarIndexBeforeKey(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.dictsWithSameField[*].int")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.dictsWithSameField[*].int")
         # Get value in every dictionary
-        expected = getJsonMapValuesRecursively(mapJsonObj["dictsWithSameField"], "int")
+        expected = getFixtureJsonMapValuesRecursively(mapJsonObj["dictsWithSameField"], "int")
 
         self.assertTrue(self.isListEqualUnsorted(results, expected))
 
     # Wildstar key tests
 
     def testGetWildstarKey(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.*")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.*")
         self.assertEqual(results, mapJsonObj)
 
     def testGetNestedWildstarKey(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.map.*")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.map.*")
         self.assertEqual(results, mapJsonObj["map"])
 
     # Recursion Tests
 
     def testGetRecursiveKey(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.dictsWithSameField..int")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.dictsWithSameField..int")
 
         # Get all field "int" values in a specific map
-        expected = getJsonMapValuesRecursively(mapJsonObj["dictsWithSameField"], "int")
+        expected = getFixtureJsonMapValuesRecursively(mapJsonObj["dictsWithSameField"], "int")
         self.assertTrue(self.isListEqualUnsorted(results, expected))
 
     def testGetRecursiveFromRoot(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$..int")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$..int")
 
         # Get all field "int" values in the entire bin document
-        expected = getJsonMapValuesRecursively(mapJsonObj, "int")
+        expected = getFixtureJsonMapValuesRecursively(mapJsonObj, "int")
         self.assertTrue(self.isListEqualUnsorted(results, expected))
 
     def testGetRecursiveWildstarKey(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$..*")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$..*")
 
         # Get all field values
-        expected = getJsonMapValuesRecursively(mapJsonObj)
+        expected = getFixtureJsonMapValuesRecursively(mapJsonObj)
         self.assertTrue(self.isListEqualUnsorted(results, expected))
 
     def testRecursiveBracket(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$..['int']")
-        expected = getJsonMapValuesRecursively(mapJsonObj, "int")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$..['int']")
+        expected = getFixtureJsonMapValuesRecursively(mapJsonObj, "int")
         self.assertTrue(self.isListEqualUnsorted(results, expected))
 
     # Filter tests
 
     def testFilterDictsWithInt(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.dictsWithSameField[?(@.int)]")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.dictsWithSameField[?(@.int)]")
         expected = mapJsonObj["dictsWithSameField"][:3]
         self.assertTrue(self.isListEqualUnsorted(results, expected))
 
     def testFilterLT(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.dictsWithSameField[?(@.int > 10)]")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.dictsWithSameField[?(@.int > 10)]")
         expected = mapJsonObj["dictsWithSameField"][1:3]
         self.assertTrue(self.isListEqualUnsorted(results, expected))
 
     def testFilterAnd(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.dictsWithSameField[?(@.int > 10 & @.int < 50)]")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.dictsWithSameField[?(@.int > 10 & @.int < 50)]")
         expected = mapJsonObj["dictsWithSameField"][1:3]
         self.assertTrue(self.isListEqualUnsorted(results, expected))
 
     def testFilterOr(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.dictsWithSameField[?(@.int < 10 | @.int > 40)]")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.dictsWithSameField[?(@.int < 10 | @.int > 40)]")
         expected = [mapJsonObj["dictsWithSameField"][0], mapJsonObj["dictsWithSameField"][1]]
         self.assertTrue(self.isListEqualUnsorted(results, expected))
 
     @unittest.skip("Unsupported")
     def testFilterLTVar(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.dictsWithSameField[?(@.int < $['compareVar'])]")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.dictsWithSameField[?(@.int < $['compareVar'])]")
         expected = mapJsonObj["dictsWithSameField"][0]
         self.assertTrue(self.isListEqualUnsorted(results, expected))
 
     def testFilterRegex(self):
         # Matches anything ending with mesa and ignores case
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.dictsWithSameField[?(@.str ~= \"(?i).*Mesa\")]")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.dictsWithSameField[?(@.str ~= \"(?i).*Mesa\")]")
         expected = [mapJsonObj["dictsWithSameField"][1]]
         self.assertTrue(self.isListEqualUnsorted(results, expected))
 
     # Function tests
 
     def testLength(self):
-        length = documentClient.get(keyTuple, MAP_BIN_NAME, "$.dictsWithSameField.length()")
+        length = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.dictsWithSameField.length()")
         self.assertEqual(len(mapJsonObj["dictsWithSameField"]), length)
 
     @unittest.skip("Unaddressed bug")
     def testLengthInQuotes(self):
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$['.length()']")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$['.length()']")
         self.assertEqual(mapJsonObj[".length()"], results)
 
     def testWildstarLength(self):
-        length = documentClient.get(keyTuple, LIST_BIN_NAME, "$[*].length()")
-        expected = [len(element) for element in listJsonObj]
-        self.assertEqual(expected, length)
+        length = documentClient.get(self.keyTuple, LIST_BIN_NAME, "$[*].length()")
+        self.assertEqual(self.expectedWildstarLengths, length)
 
     # Lists
 
     def testSlices(self):
         # [2, 4) -> [2, 3]
-        results = documentClient.get(keyTuple, LIST_BIN_NAME, "$[1][2:4]")
-        expected = listJsonObj[1][2:4]
-        self.assertEqual(expected, results)
+        results = documentClient.get(self.keyTuple, LIST_BIN_NAME, "$[1][2:4]")
+        self.assertEqual(self.expectedListSlices["$[1][2:4]"], results)
 
     def testSliceFromStart(self):
         # [_, 2) -> [0, 1]
-        results = documentClient.get(keyTuple, LIST_BIN_NAME, "$[1][:2]")
-        expected = listJsonObj[1][:2]
-        self.assertEqual(expected, results)
+        results = documentClient.get(self.keyTuple, LIST_BIN_NAME, "$[1][:2]")
+        self.assertEqual(self.expectedListSlices["$[1][:2]"], results)
 
     def testSliceFromEnd(self):
         # [2, end) -> [2, 3, ... last index]
-        results = documentClient.get(keyTuple, LIST_BIN_NAME, "$[1][2:]")
-        expected = listJsonObj[1][2:]
-        self.assertEqual(expected, results)
+        results = documentClient.get(self.keyTuple, LIST_BIN_NAME, "$[1][2:]")
+        self.assertEqual(self.expectedListSlices["$[1][2:]"], results)
 
     def testSliceFromLastIndex(self):
         # [-1, ) -> [last index]
-        results = documentClient.get(keyTuple, LIST_BIN_NAME, "$[1][-1:]")
-        expected = listJsonObj[1][-1:]
-        self.assertEqual(expected, results)
+        results = documentClient.get(self.keyTuple, LIST_BIN_NAME, "$[1][-1:]")
+        self.assertEqual(self.expectedListSlices["$[1][-1:]"], results)
 
     def testSliceToLastIndex(self):
         # [3, -1) -> [last index]
-        results = documentClient.get(keyTuple, LIST_BIN_NAME, "$[1][3:-1]")
-        expected = listJsonObj[1][3:-1]
-        self.assertEqual(expected, results)
+        results = documentClient.get(self.keyTuple, LIST_BIN_NAME, "$[1][3:-1]")
+        self.assertEqual(self.expectedListSlices["$[1][3:-1]"], results)
 
     def testSetOfIndices(self):
         # [3, 5]
-        results = documentClient.get(keyTuple, LIST_BIN_NAME, "$[1][3,5]")
-        expected = [listJsonObj[1][3], listJsonObj[1][5]]
-        self.assertEqual(expected, results)
+        results = documentClient.get(self.keyTuple, LIST_BIN_NAME, "$[1][3,5]")
+        self.assertEqual(self.expectedListSlices["$[1][3,5]"], results)
 
     def testSlicesWithStep(self):
         # [2, 5) step 1 -> [2, 4]
-        results = documentClient.get(keyTuple, LIST_BIN_NAME, "$[1][2:5:2]")
-        expected = listJsonObj[1][2:5:2]
-        self.assertEqual(expected, results)
+        results = documentClient.get(self.keyTuple, LIST_BIN_NAME, "$[1][2:5:2]")
+        self.assertEqual(self.expectedListSlices["$[1][2:5:2]"], results)
 
     def testSlicesWithEndAndStep(self):
         # [, 2) step 2 -> [0, 2]
-        results = documentClient.get(keyTuple, LIST_BIN_NAME, "$[1][:4:2]")
-        expected = listJsonObj[1][:4:2]
-        self.assertEqual(expected, results)
+        results = documentClient.get(self.keyTuple, LIST_BIN_NAME, "$[1][:4:2]")
+        self.assertEqual(self.expectedListSlices["$[1][:4:2]"], results)
 
     def testSlicesWithOnlyStep(self):
         # step 2 -> [0, 2, 4]
-        results = documentClient.get(keyTuple, LIST_BIN_NAME, "$[1][::2]")
-        expected = listJsonObj[1][::2]
-        self.assertEqual(expected, results)
-
+        results = documentClient.get(self.keyTuple, LIST_BIN_NAME, "$[1][::2]")
+        self.assertEqual(self.expectedListSlices["$[1][::2]"], results)
 
-class TestIncorrectGets(TestGets):
-
-    # Syntax errors
-
-    def testGetEmpty(self):
-        self.assertRaises(JsonPathMissingRootError, documentClient.get, keyTuple, MAP_BIN_NAME, "")
 
-    def testGetMissingRoot(self):
-        self.assertRaises(JsonPathMissingRootError, documentClient.get, keyTuple, MAP_BIN_NAME, "list")
+class TestJsonPathSyntax(unittest.TestCase):
+    # Syntax errors must be raised before the server is contacted
+    # so these tests use a mock client and don't need a record
 
-    def testGetTrailingPeriod(self):
-        self.assertRaises(JsonPathParseError, documentClient.get, keyTuple, MAP_BIN_NAME, "$.")
-        self.assertRaises(JsonPathParseError, documentClient.get, keyTuple, MAP_BIN_NAME, "$.asdf.")
-
-    def testGetTrailingRecursive(self):
-        self.assertRaises(JsonPathParseError, documentClient.get, keyTuple, MAP_BIN_NAME, "$..")
-
-    def testGetTrailingOpeningBracket(self):
-        self.assertRaises(JsonPathParseError, documentClient.get, keyTuple, LIST_BIN_NAME, "$[")
-        self.assertRaises(JsonPathParseError, documentClient.get, keyTuple, MAP_BIN_NAME, "$.list[")
+    def setUp(self):
+        self.keyTuple = recordKeyForClass(type(self))
+        self.mockClient = MagicMock()
+        self.documentClient = DocumentClient(self.mockClient)
+
+    def testGetSyntaxErrors(self):
+        for binName, jsonPath, error in GET_SYNTAX_ERROR_CASES:
+            with self.subTest(jsonPath=jsonPath):
+                self.assertRaises(error, self.documentClient.get, self.keyTuple, binName, jsonPath)
+        self.assertEqual(self.mockClient.method_calls, [])
+
+    def testGetSameSyntaxErrorTwice(self):
+        # Invalid paths are cached, but each call should still raise its own exception
+        with self.assertRaises(JsonPathParseError) as first:
+            self.documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.map[")
+        with self.assertRaises(JsonPathParseError) as second:
+            self.documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.map[")
+        self.assertIsNot(first.exception, second.exception)
+        self.assertEqual(self.mockClient.method_calls, [])
+
+    def testGetSyntaxErrorReason(self):
+        # The parser's explanation is kept when the error comes from the cache
+        for _ in range(2):
+            with self.assertRaisesRegex(JsonPathParseError, "near token"):
+                self.documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.map]")
+        self.assertEqual(self.mockClient.method_calls, [])
 
-    def testGetEmptyBrackets(self):
-        self.assertRaises(JsonPathParseError, documentClient.get, keyTuple, LIST_BIN_NAME, "$[]")
-        self.assertRaises(JsonPathParseError, documentClient.get, keyTuple, MAP_BIN_NAME, "$.list[]")
 
-    def testGetUnmatchedClosingBracket(self):
-        self.assertRaises(JsonPathParseError, documentClient.get, keyTuple, LIST_BIN_NAME, "$]")
-        self.assertRaises(JsonPathParseError, documentClient.get, keyTuple, MAP_BIN_NAME, "$.list]")
+class TestIncorrectGets(TestGets):
 
     # Access errors
 
     def testGetIndexFromMap(self):
-        self.assertRaises(JSONNotFoundError, documentClient.get, keyTuple, MAP_BIN_NAME, "$.map[0]")
+        self.assertRaises(JSONNotFoundError, documentClient.get, self.keyTuple, MAP_BIN_NAME, "$.map[0]")
 
     def testGetKeyFromList(self):
-        self.assertRaises(JSONNotFoundError, documentClient.get, keyTuple, MAP_BIN_NAME, "$.list.nonExistentKey")
+        self.assertRaises(JSONNotFoundError, documentClient.get, self.keyTuple, MAP_BIN_NAME, "$.list.nonExistentKey")
 
     def testGetIndexFromPrimitive(self):
-        self.assertRaises(JSONNotFoundError, documentClient.get, keyTuple, MAP_BIN_NAME, "$.list[0].int[0]")
+        self.assertRaises(JSONNotFoundError, documentClient.get, self.keyTuple, MAP_BIN_NAME, "$.list[0].int[0]")
 
     def testGetKeyFromPrimitive(self):
-        self.assertRaises(JSONNotFoundError, documentClient.get, keyTuple, MAP_BIN_NAME, "$.list[0].int.nonExistentKey")
+        self.assertRaises(JSONNotFoundError, documentClient.get, self.keyTuple, MAP_BIN_NAME, "$.list[0].int.nonExistentKey")
 
     def testGetFromMissingMap(self):
-        self.assertRaises(JSONNotFoundError, documentClient.get, keyTuple, MAP_BIN_NAME, "$.map.nonExistentMap.item")
+        self.assertRaises(JSONNotFoundError, documentClient.get, self.keyTuple, MAP_BIN_NAME, "$.map.nonExistentMap.item")
 
     def testGetFromMissingList(self):
-        self.assertRaises(JSONNotFoundError, documentClient.get, keyTuple, MAP_BIN_NAME, "$.map.nonExistentList[0]")
+        self.assertRaises(JSONNotFoundError, documentClient.get, self.keyTuple, MAP_BIN_NAME, "$.map.nonExistentList[0]")
 
     def testGetOutOfBoundsIndex(self):
-        self.assertRaises(JSONNotFoundError, documentClient.get, keyTuple, MAP_BIN_NAME, "$.list[1000]")
+        self.assertRaises(JSONNotFoundError, documentClient.get, self.keyTuple, MAP_BIN_NAME, "$.list[1000]")
 
     def testGetMissingKey(self):
-        self.assertRaises(JSONNotFoundError, documentClient.get, keyTuple, MAP_BIN_NAME, "$.map.nonExistentKey")
+        self.assertRaises(JSONNotFoundError, documentClient.get, self.keyTuple, MAP_BIN_NAME, "$.map.nonExistentKey")
+
+
+class TestBatchGets(TestGets):
+
+    def testBatchGetKey(self):
+        results = documentClient.batchGet([self.keyTuple, self.keyTuple], MAP_BIN_NAME, "$.map")
+        self.assertEqual(results, [mapJsonObj["map"], mapJsonObj["map"]])
+
+    def testBatchGetSlice(self):
+        results = documentClient.batchGet([self.keyTuple, self.keyTuple], LIST_BIN_NAME, "$[1][2:4]")
+        expected = listJsonObj[1][2:4]
+        self.assertEqual(results, [expected, expected])
+
+    def testBatchGetWithPolicy(self):
+        batchPolicy = {
+            "total_timeout": 2000
+        }
+        results = documentClient.batchGet([self.keyTuple, self.keyTuple], MAP_BIN_NAME, "$.map", batchPolicy)
+        self.assertEqual(results, [mapJsonObj["map"], mapJsonObj["map"]])
+
+    def testBatchGetPassesPolicy(self):
+        # The policy must reach the client as the batch policy, not as record metadata
+        mockClient = MagicMock()
+        mockClient.batch_get_ops.return_value = [(self.keyTuple, {}, {MAP_BIN_NAME: mapJsonObj["map"]})]
+        batchPolicy = {
+            "total_timeout": 2000
+        }
+        DocumentClient(mockClient).batchGet([self.keyTuple], MAP_BIN_NAME, "$.map", batchPolicy)
+        _, kwargs = mockClient.batch_get_ops.call_args
+        self.assertEqual(kwargs["policy"], batchPolicy)
+
+    def testBatchGetMissingRecord(self):
+        keys = [self.keyTuple, ('test', 'demo', 'nonExistentKey')]
+        self.assertRaises(aerospike.exception.RecordNotFound, documentClient.batchGet, keys, MAP_BIN_NAME, "$.map")
+
+    def testBatchGetMissingKey(self):
+        self.assertRaises(JSONNotFoundError, documentClient.batchGet, [self.keyTuple], MAP_BIN_NAME, "$.map.nonExistentKey")
+
+    def testBatchGetIndexFromMap(self):
+        self.assertRaises(JSONNotFoundError, documentClient.batchGet, [self.keyTuple], MAP_BIN_NAME, "$.map[0]")
+
+
+class TestGetMany(TestGets):
+
+    def testGetManyPaths(self):
+        jsonPaths = ["$", "$.map.map.int", "$.list[1][0]", "$.lists[*]"]
+        results = documentClient.getMany(self.keyTuple, MAP_BIN_NAME, jsonPaths)
+        expected = {jsonPath: documentClient.get(self.keyTuple, MAP_BIN_NAME, jsonPath) for jsonPath in jsonPaths}
+        self.assertEqual(results, expected)
+
+    def testGetManyTablePaths(self):
+        # Read every valid path with one request per bin
+        for binName in recordBins:
+            cases = [(jsonPath, getExpected) for caseBinName, jsonPath, getExpected in GET_CASES if caseBinName == binName]
+            results = documentClient.getMany(self.keyTuple, binName, [jsonPath for jsonPath, _ in cases])
+            for jsonPath, getExpected in cases:
+                with self.subTest(jsonPath=jsonPath):
+                    self.assertEqual(results[jsonPath], getExpected(recordBins[binName]))
 
+    def testGetManyMissingKey(self):
+        jsonPaths = ["$.map", "$.map.nonExistentKey"]
+        self.assertRaises(JSONNotFoundError, documentClient.getMany, self.keyTuple, MAP_BIN_NAME, jsonPaths)
+
+    def testGetManyIndexFromMap(self):
+        jsonPaths = ["$.map", "$.map[0]"]
+        self.assertRaises(JSONNotFoundError, documentClient.getMany, self.keyTuple, MAP_BIN_NAME, jsonPaths)
+
+
+class TestWriteRecord(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Each test class uses its own record
+        # so test classes don't depend on each other
+        cls.keyTuple = recordKeyForClass(cls)
+
+    @classmethod
+    def tearDownClass(cls):
+        client.remove(cls.keyTuple)
+
+
+class TestWrites(TestWriteRecord):
 
-class TestWrites(unittest.TestCase):
     def setUp(self):
-        client.put(keyTuple, {MAP_BIN_NAME: mapJsonObj, LIST_BIN_NAME: listJsonObj})
+        # Overwrite both bins so changes from the previous test are undone
+        client.put(self.keyTuple, recordBins)
 
-    def tearDown(self):
-        client.remove(keyTuple)
+
+class TestFailedWrites(TestWriteRecord):
+    # Writes in these tests fail or leave the record unchanged
+    # so the record only needs to be inserted once per class
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        client.put(cls.keyTuple, recordBins)
 
 
 class TestCorrectPuts(TestWrites):
@@ -479,207 +599,248 @@ class TestCorrectPuts(TestWrites):
 
     def testPutNewRootAsMap(self):
         # Override setup
-        client.remove(keyTuple)
+        client.remove(self.keyTuple)
 
-        documentClient.put(keyTuple, MAP_BIN_NAME, "$", {})
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$")
+        documentClient.put(self.keyTuple, MAP_BIN_NAME, "$", {})
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$")
         self.assertEqual(results, {})
 
     def testPutNewRootAsList(self):
         # Override setup
-        client.remove(keyTuple)
+        client.remove(self.keyTuple)
 
-        documentClient.put(keyTuple, MAP_BIN_NAME, "$", [])
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$")
+        documentClient.put(self.keyTuple, MAP_BIN_NAME, "$", [])
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$")
         self.assertEqual(results, [])
 
     def testReplaceRootWithMap(self):
-        documentClient.put(keyTuple, MAP_BIN_NAME, "$", {})
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$")
+        documentClient.put(self.keyTuple, MAP_BIN_NAME, "$", {})
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$")
         self.assertEqual(results, {})
 
     def testReplaceRootWithList(self):
-        documentClient.put(keyTuple, MAP_BIN_NAME, "$", [])
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$")
+        documentClient.put(self.keyTuple, MAP_BIN_NAME, "$", [])
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$")
         self.assertEqual(results, [])
 
     def testPutIntoMap(self):
-        documentClient.put(keyTuple, MAP_BIN_NAME, "$.map.item", "hi")
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.map.item")
+        documentClient.put(self.keyTuple, MAP_BIN_NAME, "$.map.item", "hi")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.map.item")
         self.assertEqual(results, "hi")
 
+    def testPutKeyNamedLikeRoot(self):
+        documentClient.put(self.keyTuple, MAP_BIN_NAME, "$.map['$']", "hi")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.map")
+        self.assertEqual(results["$"], "hi")
+        self.assertEqual(results["map"], mapJsonObj["map"]["map"])
+
     def testPutExistingListItem(self):
-        documentClient.put(keyTuple, MAP_BIN_NAME, "$.list[0]", 2)
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.list[0]")
+        documentClient.put(self.keyTuple, MAP_BIN_NAME, "$.list[0]", 2)
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.list[0]")
         self.assertEqual(results, 2)
 
 
 class TestPutsAdvancedOps(TestWrites):
 
     def testPutDeepScan(self):
-        documentClient.put(keyTuple, MAP_BIN_NAME, "$..int", 99)
+        documentClient.put(self.keyTuple, MAP_BIN_NAME, "$..int", 99)
 
         # All ints should be 99
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$")
-        intValues = getJsonMapValuesRecursively(results, "int")
-        areIntsAll99 = all([value == intValues[0] for value in intValues])
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$")
+        # Stops at the first value that isn't 99
+        areIntsAll99 = all(value == 99 for value in getJsonMapValuesRecursively(results, "int"))
 
         self.assertTrue(areIntsAll99)
 
 
-class TestIncorrectPuts(TestWrites):
+class TestIncorrectPuts(TestFailedWrites):
 
     def testPutIntoMissingMap(self):
-        self.assertRaises(JSONNotFoundError, documentClient.put, keyTuple, MAP_BIN_NAME, "$.map.nonExistentMap.item", 4)
+        self.assertRaises(JSONNotFoundError, documentClient.put, self.keyTuple, MAP_BIN_NAME, "$.map.nonExistentMap.item", 4)
 
     def testPutIntoMissingList(self):
-        self.assertRaises(JSONNotFoundError, documentClient.put, keyTuple, MAP_BIN_NAME, "$.map.nonExistentList[0]", 4)
+        self.assertRaises(JSONNotFoundError, documentClient.put, self.keyTuple, MAP_BIN_NAME, "$.map.nonExistentList[0]", 4)
 
     def testPutIntoMapAsList(self):
-        self.assertRaises(JSONNotFoundError, documentClient.put, keyTuple, MAP_BIN_NAME, "$.map.nonExistentMap[0]", 4)
+        self.assertRaises(JSONNotFoundError, documentClient.put, self.keyTuple, MAP_BIN_NAME, "$.map.nonExistentMap[0]", 4)
 
     def testPutIntoListAsMap(self):
-        self.assertRaises(JSONNotFoundError, documentClient.put, keyTuple, MAP_BIN_NAME, "$.map.nonExistentList.item", 4)
+        self.assertRaises(JSONNotFoundError, documentClient.put, self.keyTuple, MAP_BIN_NAME, "$.map.nonExistentList.item", 4)
 
 
 class TestCorrectAppend(TestWrites):
 
     def testAppendIndexAccess(self):
-        documentClient.append(keyTuple, MAP_BIN_NAME, "$.list[1]", 50)
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.list[1]")
+        documentClient.append(self.keyTuple, MAP_BIN_NAME, "$.list[1]", 50)
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.list[1]")
         self.assertEqual(results, [1, 50])
 
     def testAppendKeyAccess(self):
-        documentClient.append(keyTuple, MAP_BIN_NAME, "$.list", 42)
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.list")
+        documentClient.append(self.keyTuple, MAP_BIN_NAME, "$.list", 42)
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.list")
         expected = [{"int": 1}, [1], 42]
         self.assertEqual(results, expected)
 
+    def testAppendToRoot(self):
+        documentClient.append(self.keyTuple, LIST_BIN_NAME, "$", 42)
+        results = documentClient.get(self.keyTuple, LIST_BIN_NAME, "$")
+        self.assertEqual(results, listJsonObj + [42])
+
     def testAppendWildstar(self):
-        documentClient.append(keyTuple, MAP_BIN_NAME, "$.lists[*]", 44)
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.lists")
+        documentClient.append(self.keyTuple, MAP_BIN_NAME, "$.lists[*]", 44)
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.lists")
 
-        expectedLists = mapJsonObj["lists"]
+        # Don't modify the shared document
+        expectedLists = cloneJson(mapJsonObj["lists"])
         for list in expectedLists:
             list.append(44)
 
         self.assertEqual(results, expectedLists)
 
 
-class TestIncorrectAppend(TestWrites):
+class TestIncorrectAppend(TestFailedWrites):
 
     def testAppendMissingList(self):
-        self.assertRaises(JSONNotFoundError, documentClient.append, keyTuple, MAP_BIN_NAME, "$.map.nonExistentList", 4)
+        self.assertRaises(JSONNotFoundError, documentClient.append, self.keyTuple, MAP_BIN_NAME, "$.map.nonExistentList", 4)
 
     # TODO: replace with custom errors?
 
     def testAppendMap(self):
-        self.assertRaises(AttributeError, documentClient.append, keyTuple, MAP_BIN_NAME, "$.map", 4)
+        self.assertRaises(AttributeError, documentClient.append, self.keyTuple, MAP_BIN_NAME, "$.map", 4)
 
     def testAppendPrimitive(self):
-        self.assertRaises(AttributeError, documentClient.append, keyTuple, MAP_BIN_NAME, "$.map.map.int", 4)
+        self.assertRaises(AttributeError, documentClient.append, self.keyTuple, MAP_BIN_NAME, "$.map.map.int", 4)
+
+    def testAppendRootMap(self):
+        self.assertRaises(AttributeError, documentClient.append, self.keyTuple, MAP_BIN_NAME, "$", 4)
+
+    def testAppendIndexInMap(self):
+        self.assertRaises(JSONNotFoundError, documentClient.append, self.keyTuple, MAP_BIN_NAME, "$.map[0]", 4)
+
+    def testAppendKeyInList(self):
+        self.assertRaises(JSONNotFoundError, documentClient.append, self.keyTuple, MAP_BIN_NAME, "$.list.nonExistentKey", 4)
+
+    def testAppendMissingRecord(self):
+        # Appending must not create the record
+        missingKeyTuple = ('test', 'demo', 'nonExistentKey')
+        for jsonPath in ("$", "$.list"):
+            with self.subTest(jsonPath=jsonPath):
+                self.assertRaises(aerospike.exception.RecordNotFound, documentClient.append, missingKeyTuple, MAP_BIN_NAME,
+                                  jsonPath, 4)
+                _, meta = client.exists(missingKeyTuple)
+                self.assertIsNone(meta)
+
+    def testAppendMissingRecordWithExistsPolicy(self):
+        # The exists policy from the caller is ignored
+        missingKeyTuple = ('test', 'demo', 'nonExistentKey')
+        operatePolicy = {"exists": aerospike.POLICY_EXISTS_IGNORE}
+        self.assertRaises(aerospike.exception.RecordNotFound, documentClient.append, missingKeyTuple, MAP_BIN_NAME,
+                          "$.list", 4, operatePolicy)
+        _, meta = client.exists(missingKeyTuple)
+        self.assertIsNone(meta)
 
 
 class TestCorrectDelete(TestWrites):
 
     def testDeleteRoot(self):
-        documentClient.delete(keyTuple, MAP_BIN_NAME, "$")
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$")
+        documentClient.delete(self.keyTuple, MAP_BIN_NAME, "$")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$")
         self.assertEqual(results, {})
 
     def testDeletePrimitiveFromMap(self):
-        documentClient.delete(keyTuple, MAP_BIN_NAME, "$.map.map.int")
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.map.map")
+        documentClient.delete(self.keyTuple, MAP_BIN_NAME, "$.map.map.int")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.map.map")
 
-        expectedJsonObj = copy.deepcopy(mapJsonObj)
-        del expectedJsonObj["map"]["map"]["int"]
+        expectedMap = cloneJson(mapJsonObj["map"]["map"])
+        del expectedMap["int"]
 
-        self.assertEqual(results, expectedJsonObj["map"]["map"])
+        self.assertEqual(results, expectedMap)
 
     def testDeletePrimitiveFromList(self):
-        documentClient.delete(keyTuple, MAP_BIN_NAME, "$.list[1][0]")
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.list[1]")
+        documentClient.delete(self.keyTuple, MAP_BIN_NAME, "$.list[1][0]")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.list[1]")
 
-        expectedJsonObj = copy.deepcopy(mapJsonObj)
-        del expectedJsonObj["list"][1][0]
+        expectedList = cloneJson(mapJsonObj["list"][1])
+        del expectedList[0]
 
-        self.assertEqual(results, expectedJsonObj["list"][1])
+        self.assertEqual(results, expectedList)
 
     def testDeleteMapFromMap(self):
-        documentClient.delete(keyTuple, MAP_BIN_NAME, "$.map.map")
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.map")
+        documentClient.delete(self.keyTuple, MAP_BIN_NAME, "$.map.map")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.map")
 
-        expectedJsonObj = copy.deepcopy(mapJsonObj)
-        del expectedJsonObj["map"]["map"]
+        expectedMap = cloneJson(mapJsonObj["map"])
+        del expectedMap["map"]
 
-        self.assertEqual(results, expectedJsonObj["map"])
+        self.assertEqual(results, expectedMap)
 
     def testDeleteListFromMap(self):
-        documentClient.delete(keyTuple, MAP_BIN_NAME, "$.map.list")
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.map")
+        documentClient.delete(self.keyTuple, MAP_BIN_NAME, "$.map.list")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.map")
 
-        expectedJsonObj = copy.deepcopy(mapJsonObj)
-        del expectedJsonObj["map"]["list"]
+        expectedMap = cloneJson(mapJsonObj["map"])
+        del expectedMap["list"]
 
-        self.assertEqual(results, expectedJsonObj["map"])
+        self.assertEqual(results, expectedMap)
 
     def testDeleteMapFromList(self):
-        documentClient.delete(keyTuple, MAP_BIN_NAME, "$.list[0]")
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.list")
+        documentClient.delete(self.keyTuple, MAP_BIN_NAME, "$.list[0]")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.list")
 
-        expectedJsonObj = copy.deepcopy(mapJsonObj)
-        del expectedJsonObj["list"][0]
+        # Only the list itself changes, so a shallow copy is enough
+        expectedList = list(mapJsonObj["list"])
+        del expectedList[0]
 
-        self.assertEqual(results, expectedJsonObj["list"])
+        self.assertEqual(results, expectedList)
 
     def testDeleteListFromList(self):
-        documentClient.delete(keyTuple, MAP_BIN_NAME, "$.list[1]")
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$.list")
+        documentClient.delete(self.keyTuple, MAP_BIN_NAME, "$.list[1]")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$.list")
 
-        expectedJsonObj = copy.deepcopy(mapJsonObj)
-        del expectedJsonObj["list"][1]
+        expectedList = list(mapJsonObj["list"])
+        del expectedList[1]
 
-        self.assertEqual(results, expectedJsonObj["list"])
+        self.assertEqual(results, expectedList)
 
 
 class TestDeleteAdvancedOps(TestWrites):
 
     def testDeepScanDelete(self):
-        documentClient.delete(keyTuple, MAP_BIN_NAME, "$..int")
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$")
+        documentClient.delete(self.keyTuple, MAP_BIN_NAME, "$..int")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$")
 
-        expectedJsonObj = copy.deepcopy(mapJsonObj)
+        expectedJsonObj = cloneJson(mapJsonObj)
         deleteJsonMapValuesRecursively(expectedJsonObj, "int")
 
         self.assertEqual(results, expectedJsonObj)
 
     def testDeleteDeepScanWildstar(self):
-        documentClient.delete(keyTuple, MAP_BIN_NAME, "$..*")
-        results = documentClient.get(keyTuple, MAP_BIN_NAME, "$")
+        documentClient.delete(self.keyTuple, MAP_BIN_NAME, "$..*")
+        results = documentClient.get(self.keyTuple, MAP_BIN_NAME, "$")
 
         self.assertEqual(results, {})
 
 
-class TestIncorrectDelete(TestWrites):
+class TestIncorrectDelete(TestFailedWrites):
 
     def testDeleteMissingKey(self):
         # No exception will be raised
-        documentClient.delete(keyTuple, MAP_BIN_NAME, "$.map.nonExistentKey")
+        documentClient.delete(self.keyTuple, MAP_BIN_NAME, "$.map.nonExistentKey")
 
     def testDeleteOutOfBoundsIndex(self):
-        self.assertRaises(JSONNotFoundError, documentClient.delete, keyTuple, MAP_BIN_NAME, "$.list[1000]")
+        self.assertRaises(JSONNotFoundError, documentClient.delete, self.keyTuple, MAP_BIN_NAME, "$.list[1000]")
 
     def testDeleteKeyInList(self):
-        self.assertRaises(JSONNotFoundError, documentClient.delete, keyTuple, MAP_BIN_NAME, "$.list.nonExistentKey")
+        self.assertRaises(JSONNotFoundError, documentClient.delete, self.keyTuple, MAP_BIN_NAME, "$.list.nonExistentKey")
 
     def testDeleteIndexInMap(self):
-        self.assertRaises(JSONNotFoundError, documentClient.delete, keyTuple, MAP_BIN_NAME, "$.map[0]")
+        self.assertRaises(JSONNotFoundError, documentClient.delete, self.keyTuple, MAP_BIN_NAME, "$.map[0]")
 
     def testDeleteFromMissingMap(self):
-        self.assertRaises(JSONNotFoundError, documentClient.delete, keyTuple, MAP_BIN_NAME, "$.map.nonExistentMap.item")
+        self.assertRaises(JSONNotFoundError, documentClient.delete, self.keyTuple, MAP_BIN_NAME, "$.map.nonExistentMap.item")
 
     def testDeleteFromMissingList(self):
-        self.assertRaises(JSONNotFoundError, documentClient.delete, keyTuple, MAP_BIN_NAME, "$.map.nonExistentList[0]")
+        self.assertRaises(JSONNotFoundError, documentClient.delete, self.keyTuple, MAP_BIN_NAME, "$.map.nonExistentList[0]")
 
 
 if __name__ == "__main__":